@@ -10,8 +10,8 @@ import re
 import shutil
 import textwrap
 from pathlib import Path
-from collections import Counter
 
+import numpy as np
 import pandas as pd
 import tuning_library as tl
 
@@ -25,13 +25,14 @@ logger = logging.getLogger(__name__)
 
 DUPE_TOLERANCE_CENTS = 5.0
 
+_REFERENCE_WRAPPER = textwrap.TextWrapper()
+
 
 class Columns:
     authors = "Authors"
     country = "Country"
     culture = "Culture"
     instrument = "Instrument"
-    interval = "interval"
     measured_id = "MeasuredID"
     name = "Name"
     octave_modified = "Octave_modified"
@@ -40,7 +41,6 @@ class Columns:
     reference = "Reference"
     region = "Region"
     scale_id = "ScaleID"
-    step = "step"
     theory = "Theory"
     theory_id = "TheoryID"
     title = "Title"
@@ -51,31 +51,55 @@ class Columns:
 
 C = Columns
 
+MEASURED_COLUMNS = [
+    C.country,
+    "Intervals",
+    C.instrument,
+    C.measured_id,
+    C.name,
+    C.octave_modified,
+    C.primary_source,
+    C.ref_id,
+    C.reference,
+]
+SOURCE_INFO_COLUMNS = [C.ref_id, "Reference_Full", "doi", "best_reference"]
+
+
+def _parse_intervals(intervals_str):
+    """Parse ";"-separated floats, raising ValueError on empty or missing fields."""
+    intervals = np.fromstring(intervals_str, sep=";")
+    # fromstring silently drops an empty last field, e.g. "100;200;"
+    if len(intervals) != intervals_str.count(";") + 1:
+        raise ValueError(f"Malformed intervals {intervals_str!r}")
+    return intervals
+
 
 def _parse_cumulative_cents(intervals_str):
-    steps = [float(x) for x in intervals_str.strip().split(";")]
-    cumulative = []
-    total = 0.0
-    for s in steps:
-        total += s
-        cumulative.append(total)
-    return tuple(cumulative)
+    return np.cumsum(_parse_intervals(intervals_str))
 
 
-def _find_near_dupe_ids(measured_scales):
+def _find_near_dupe_ids(measured_scales, cents):
     """Return set of MeasuredIDs to exclude: non-primary scales that are
-    near-identical (within DUPE_TOLERANCE_CENTS) to a primary source scale."""
+    near-identical (within DUPE_TOLERANCE_CENTS) to a primary source scale.
+
+    cents maps each MeasuredID to its cumulative cents."""
+    is_primary = measured_scales[C.primary_source] == "Y"
+    is_secondary = measured_scales[C.primary_source] == "N"
+
+    # Stack primary scales with the same number of notes into one 2D array,
+    # so each comparison against them is a single vectorised operation
     primary_cents = {}
-    for _, row in measured_scales[measured_scales[C.primary_source] == "Y"].iterrows():
-        primary_cents[row[C.measured_id]] = _parse_cumulative_cents(row["Intervals"])
+    for mid in measured_scales.loc[is_primary, C.measured_id]:
+        primary_cents.setdefault(len(cents[mid]), []).append(cents[mid])
+    primary_cents = {n: np.vstack(x) for n, x in primary_cents.items()}
 
     exclude = set()
-    for _, row in measured_scales[measured_scales[C.primary_source] == "N"].iterrows():
-        cents = _parse_cumulative_cents(row["Intervals"])
-        for pcents in primary_cents.values():
-            if len(cents) == len(pcents) and max(abs(a - b) for a, b in zip(cents, pcents)) <= DUPE_TOLERANCE_CENTS:
-                exclude.add(row[C.measured_id])
-                break
+    for mid in measured_scales.loc[is_secondary, C.measured_id]:
+        pcents = primary_cents.get(len(cents[mid]))
+        if pcents is None:
+            continue
+        if (np.abs(pcents - cents[mid]).max(axis=1) <= DUPE_TOLERANCE_CENTS).any():
+            exclude.add(mid)
     return exclude
 
 
@@ -87,16 +111,25 @@ _COUNTRY_CORRECTIONS = {
 }
 
 
+_STEM_TRANSLATION = str.maketrans(
+    {
+        ".": None,
+        "'": None,
+        "\u2019": None,
+        " ": "_",
+        "/": "_",
+        "&": "and",
+        "[": None,
+        "]": None,
+    }
+)
+
+_THEORY_FILENAME_TRANSLATION = str.maketrans({" ": "_", "/": "_"})
+
+
 def _make_base_stem(row):
     def clean(s):
-        return (re.sub(r' -\s*', '_', s)
-                 .replace(".", "")
-                 .replace("'", "").replace("\u2019", "")
-                 .replace(" ", "_")
-                 .replace("/", "_")
-                 .replace("&", "and")
-                 .replace("[", "")
-                 .replace("]", ""))
+        return re.sub(r' -\s*', '_', s).translate(_STEM_TRANSLATION)
 
     def pad_numbers(s):
         return re.sub(r'\d+', lambda m: m.group().zfill(2), s)
@@ -121,20 +154,17 @@ def _make_base_stem(row):
 
 def _assign_filenames(df):
     """Return dict MeasuredID -> filename, using _a/_b suffixes for clashes."""
-    stems = {row[C.measured_id]: _make_base_stem(row) for _, row in df.iterrows()}
-    stem_counts = Counter(stems.values())
-    clash_stems = {s for s, count in stem_counts.items() if count > 1}
+    stem_mids = {}
+    for row in df.to_dict("records"):
+        stem_mids.setdefault(_make_base_stem(row), []).append(row[C.measured_id])
 
     filenames = {}
-    clash_counter = Counter()
-    for mid in sorted(stems):  # sorted by MeasuredID so lower ID gets _a
-        stem = stems[mid]
-        if stem in clash_stems:
-            idx = clash_counter[stem]
-            clash_counter[stem] += 1
+    for stem, mids in stem_mids.items():
+        if len(mids) == 1:
+            filenames[mids[0]] = f"{stem}.scl"
+            continue
+        for idx, mid in enumerate(sorted(mids)):  # sorted so lower ID gets _a
             filenames[mid] = f"{stem}_{chr(ord('a') + idx)}.scl"
-        else:
-            filenames[mid] = f"{stem}.scl"
     return filenames
 
 
@@ -170,50 +200,34 @@ def _make_description(row):
     return f"{name}, {country}"
 
 
-def measured_df_to_scl(df, filename, source_info):
-    assert len(df) == 1
-    df = df.copy()
-    info = df.squeeze()
-
-    df[C.step] = df["Intervals"].str.split(";")
-    scale_df = df.explode(C.step)
-    scale_df[C.step] = scale_df[C.step].astype(float)
-    scale_df[C.interval] = scale_df.groupby("MeasuredID")[C.step].transform("cumsum")
-    intervals = [" " + x for x in scale_df[C.interval].round(6).astype(str)]
+def measured_row_to_scl(row, cents, filename, source_info):
+    intervals = np.char.add(" ", cents.round(6).astype(str)).tolist()
 
-    if info[C.octave_modified] == "Y":
+    if row[C.octave_modified] == "Y":
         intervals.append(" 1200.0 ! Octave added to measured scale")
 
-    description = _make_description(info)
+    description = _make_description(row)
 
-    reference_text = source_info.get("best_reference") or source_info.get("Reference_Full") or info[C.reference]
-    reference_lines = ["! " + x for x in textwrap.wrap(reference_text)]
+    reference_text = source_info.get("best_reference") or source_info.get("Reference_Full") or row[C.reference]
+    reference_lines = ["! " + x for x in _REFERENCE_WRAPPER.wrap(reference_text)]
 
     info_lines = [
         "! [info]",
         "! source = DaMuSc",
-        f"! measured_id = {info[C.measured_id]}",
-        f"! ref_id = {info[C.ref_id]}",
-        f"! country = {_display_country(info[C.country])}",
+        f"! measured_id = {row[C.measured_id]}",
+        f"! ref_id = {row[C.ref_id]}",
+        f"! country = {_display_country(row[C.country])}",
     ]
     doi = source_info.get("doi", "")
     if doi and str(doi) != "nan":
         info_lines.append(f"! doi = https://doi.org/{doi}")
 
-    scl_lines = (
-        [
-            f"! {filename}",
-            "!",
-            description,
-            f" {len(intervals)}",
-            "!",
-        ]
-        + intervals
-        + ["!"]
-        + reference_lines
-        + ["!"]
-        + info_lines
-    )
+    scl_lines = [f"! {filename}", "!", description, f" {len(intervals)}", "!"]
+    scl_lines += intervals
+    scl_lines += ["!"]
+    scl_lines += reference_lines
+    scl_lines += ["!"]
+    scl_lines += info_lines
 
     scl_text = "\n".join(scl_lines) + "\n"
 
@@ -221,67 +235,70 @@ def measured_df_to_scl(df, filename, source_info):
 
 
 def write_measured_scales():
-    measured_scales = pd.read_csv(DAMUSC_DIR / "Data/measured_scales.csv")
-    sources = pd.read_csv(DAMUSC_SOURCES_CSV)
-    source_info = {str(row["RefID"]): row.to_dict() for _, row in sources.iterrows()}
+    measured_scales = pd.read_csv(
+        DAMUSC_DIR / "Data/measured_scales.csv", usecols=MEASURED_COLUMNS
+    )
+    sources = pd.read_csv(DAMUSC_SOURCES_CSV, usecols=SOURCE_INFO_COLUMNS)
+    source_info = sources.set_index(sources[C.ref_id].astype(str)).to_dict("index")
+
+    assert measured_scales[C.measured_id].is_unique
+    cents = {
+        mid: _parse_cumulative_cents(intervals)
+        for mid, intervals in zip(
+            measured_scales[C.measured_id], measured_scales["Intervals"]
+        )
+    }
 
-    exclude_ids = _find_near_dupe_ids(measured_scales)
+    exclude_ids = _find_near_dupe_ids(measured_scales, cents)
     logger.info("Excluding %d near-duplicate non-primary scales", len(exclude_ids))
 
-    df = measured_scales[~measured_scales[C.measured_id].isin(exclude_ids)].copy()
+    df = measured_scales[~measured_scales[C.measured_id].isin(exclude_ids)]
     filenames = _assign_filenames(df)
 
+    scl_texts = {}
     references = {}
-    for mid, scale_df in df.groupby(C.measured_id):
-        filename = filenames[mid]
-        ref_id = str(scale_df.iloc[0][C.ref_id])
-        info = source_info.get(ref_id, {})
-        scl_text = measured_df_to_scl(scale_df, filename, info)
-        (OUTPUT_DIR / filename).write_text(scl_text)
+    for row in df.sort_values(C.measured_id).to_dict("records"):
+        filename = filenames[row[C.measured_id]]
+        info = source_info.get(str(row[C.ref_id]), {})
+        scl_texts[filename] = measured_row_to_scl(
+            row, cents[row[C.measured_id]], filename, info
+        )
         references[filename] = info["best_reference"]
 
-    return references
+    utils.write_scl_files(OUTPUT_DIR, scl_texts)
 
+    return references
 
-def theory_df_to_scl(df):
-    assert len(df) == 1
-    df = df.copy()
-    info = df.squeeze()
 
-    df[C.interval] = df[C.tonic_intervals].str.split(";")
-    scale_df = df.explode(C.interval)
-    scale_df[C.interval] = scale_df[C.interval].astype(float)
-    intervals = [" " + x for x in scale_df[C.interval].round(6).astype(str)]
+def theory_row_to_scl(row):
+    tonic_intervals = _parse_intervals(row[C.tonic_intervals])
+    intervals = np.char.add(" ", tonic_intervals.round(6).astype(str)).tolist()
 
     filename = (
-        (info[C.theory_id] + "_" + info[C.name] + "_" + info[C.tuning] + ".scl")
-        .replace(" ", "_")
-        .replace("/", "_")
-    )
+        row[C.theory_id] + "_" + row[C.name] + "_" + row[C.tuning] + ".scl"
+    ).translate(_THEORY_FILENAME_TRANSLATION)
 
-    reference_lines = ["! " + x for x in textwrap.wrap(info[C.reference])]
-
-    scl_lines = (
-        [
-            f"! {filename}",
-            "!",
-            f"Theory scale {info[C.theory_id]} in DaMuSc in {info[C.tuning]}",
-            f" {len(intervals)}",
-            "!",
-        ]
-        + intervals
-        + ["!"]
-        + reference_lines
-        + [
-            "!",
-            "! [info]",
-            "! source = DaMuSc",
-            f"! scale_id = {info[C.scale_id]}",
-            f"! theory_id = {info[C.theory_id]}",
-            f"! tuning = {info[C.tuning]}",
-            f"! ref_id = {info[C.ref_id]}",
-        ]
-    )
+    reference_lines = ["! " + x for x in _REFERENCE_WRAPPER.wrap(row[C.reference])]
+
+    scl_lines = [
+        f"! {filename}",
+        "!",
+        f"Theory scale {row[C.theory_id]} in DaMuSc in {row[C.tuning]}",
+        f" {len(intervals)}",
+        "!",
+    ]
+    scl_lines += intervals
+    scl_lines += ["!"]
+    scl_lines += reference_lines
+    scl_lines += [
+        "!",
+        "! [info]",
+        "! source = DaMuSc",
+        f"! scale_id = {row[C.scale_id]}",
+        f"! theory_id = {row[C.theory_id]}",
+        f"! tuning = {row[C.tuning]}",
+        f"! ref_id = {row[C.ref_id]}",
+    ]
 
     scl_text = "\n".join(scl_lines) + "\n"
 
@@ -291,7 +308,10 @@ def theory_df_to_scl(df):
 def write_theory_scales():
     octave_scales = pd.read_csv(DAMUSC_DIR / "Data/octave_scales.csv")
     theory_scales = pd.read_csv(DAMUSC_DIR / "Data/theory_scales.csv")
-    sources = pd.read_csv(DAMUSC_DIR / "MetaData/sources.csv")
+    sources = pd.read_csv(
+        DAMUSC_DIR / "MetaData/sources.csv",
+        usecols=[C.ref_id, C.authors, C.year, C.title],
+    )
 
     theory_octave_scales = octave_scales.loc[octave_scales[C.theory] == "Y"]
 
@@ -301,7 +321,7 @@ def write_theory_scales():
     )
     df = theory_octave_scales.merge(ref_df)
     assert len(df) == len(theory_octave_scales)
-    df2 = df.merge(sources[[C.ref_id, C.authors, C.year, C.title]].drop_duplicates())
+    df2 = df.merge(sources.drop_duplicates())
     assert len(df2) == len(df)
 
     df3 = df2.loc[
@@ -311,9 +331,13 @@ def write_theory_scales():
         )
     ]
 
-    for _, scale_df in df3.groupby(C.scale_id):
-        filename, scl_text = theory_df_to_scl(scale_df)
-        (OUTPUT_DIR / filename).write_text(scl_text)
+    assert df3[C.scale_id].is_unique
+    scl_texts = {}
+    for row in df3.sort_values(C.scale_id).to_dict("records"):
+        filename, scl_text = theory_row_to_scl(row)
+        scl_texts[filename] = scl_text
+
+    utils.write_scl_files(OUTPUT_DIR, scl_texts)
 
 
 def main():
@@ -7,23 +7,27 @@ For Chalmers' Divisions of the Tetrachord, see:
 
 """
 
+import functools
 import logging
 import math
 import shutil
 from collections import defaultdict
 from dataclasses import dataclass
 from fractions import Fraction
-from typing import Optional
-
-from sympy import Expr, Integer, Rational, evaluate, simplify, sqrt
+from typing import TYPE_CHECKING, Optional
 
 from scale_library import SCALES_DIR, utils
-from scale_library.xenharmonikon import Author
+from scale_library.xenharmonikon import Author, cprod, csum
+
+# SymPy is slow to import and only needed for the semi-tempered tetrachords,
+# so it is imported where those are built and rendered
+if TYPE_CHECKING:
+    from sympy import Expr
 
 logger = logging.getLogger(__name__)
 
-F = Fraction
-Step = Fraction | float
+# Cached so the many repeated catalog steps share one immutable Fraction each
+F = functools.cache(Fraction)
 
 OUTPUT_DIR = SCALES_DIR / "divisions-of-the-tetrachord"
 EPSILON = 1e-12
@@ -35,6 +39,41 @@ REFERENCE_LINES = [
     "! Frog Peak Music, 1993.",
 ]
 
+# Lines shared by every scl file, up to the catalog index
+TRAILER_LINES = REFERENCE_LINES + [
+    "!",
+    "! [info]",
+    "! source = Divisions of the Tetrachord",
+]
+
+TRAILER = "\n".join(TRAILER_LINES)
+
+# Data such as the trailer is passed in as fields, so braces in it are never parsed
+SCL_TEMPLATE = "\n".join(
+    [
+        "! {filename}",
+        "!",
+        "{description}",
+        " 3",
+        "!",
+        "{intervals}{comment}",
+        "{trailer}",
+        "! catalog_index = {index}",
+        "",
+    ]
+)
+
+
+def render_scl(filename, description, intervals, index, comment=None):
+    return SCL_TEMPLATE.format(
+        filename=filename,
+        description=description,
+        intervals="\n".join(f" {x}" for x in intervals),
+        comment="" if comment is None else f"\n!\n! {comment}",
+        trailer=TRAILER,
+        index=index,
+    )
+
 
 class Genus:
     H1 = "H1"
@@ -238,54 +277,37 @@ class Reference:
 R = Reference
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Tetrachord:
     index: int
-    steps: tuple[Step, Step, Step]
+    steps: tuple[Fraction, Fraction, Fraction]
     genus: str
     reference: Optional[str] = None
     comment: Optional[str] = None
 
     def __post_init__(self):
-        assert math.prod(self.steps) == F(4, 3)
+        # Cross-multiply rather than multiply Fractions, which runs a gcd per product
+        if __debug__:
+            a, b, c = self.steps
+            assert 3 * a.numerator * b.numerator * c.numerator == (
+                4 * a.denominator * b.denominator * c.denominator
+            )
 
     def to_scl(self):
         filename = FILENAME.format(self.index, self.genus)
 
-        intervals = []
-        current_interval = 1
-        for step in self.steps:
-            current_interval *= step
-            intervals.append(current_interval)
+        intervals = cprod(self.steps)
 
         assert len(intervals) == 3
         assert intervals[-1] == F(4, 3)
 
-        description = f"{category(self)} tetrachord " + " * ".join(
-            str(x) for x in self.steps
-        )
+        description = f"{category(self)} tetrachord " + " * ".join(map(str, self.steps))
         if self.reference is not None:
             description += f", {self.reference}"
 
-        scl_lines = [
-            f"! {filename}",
-            "!",
-            description,
-            " 3",
-            "!",
-        ] + [f" {x}" for x in intervals]
-
-        if self.comment is not None:
-            scl_lines += ["!", f"! {self.comment}"]
-
-        scl_lines += REFERENCE_LINES + [
-            "!",
-            "! [info]",
-            "! source = Divisions of the Tetrachord",
-            f"! catalog_index = {self.index}",
-        ]
-
-        scl_text = "\n".join(scl_lines) + "\n"
+        scl_text = render_scl(
+            filename, description, intervals, self.index, self.comment
+        )
 
         return filename, scl_text
 
@@ -293,7 +315,7 @@ class Tetrachord:
 Part = int | float | Fraction
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PartsTetrachord:
     index: int
     parts: tuple[Part, Part, Part]
@@ -308,49 +330,34 @@ class PartsTetrachord:
 
         total_parts = sum(self.parts)
         steps = [self.fourth * x / total_parts for x in self.parts]
-        for step, cents in zip(steps, self.cents):
-            # Some printed cent values are rounded as e.g. 66.6666 -> 66
-            assert abs(round(step) - cents) <= 1
+        if __debug__:
+            for step, cents in zip(steps, self.cents):
+                # Some printed cent values are rounded as e.g. 66.6666 -> 66
+                assert abs(round(step) - cents) <= 1
 
-        intervals = []
-        current_interval = 0.0
-        for step in steps:
-            current_interval += step
-            intervals.append(current_interval)
+        intervals = csum(steps)
 
         assert len(intervals) == 3
         assert abs(intervals[-1] - self.fourth) < EPSILON
 
         description = "Aristoxenian style tetrachord " + " + ".join(
-            str(x) for x in self.parts
+            map(str, self.parts)
         )
         if self.reference is not None:
             description += f", {self.reference}"
 
-        scl_lines = [
-            f"! {filename}",
-            "!",
+        scl_text = render_scl(
+            filename,
             description,
-            " 3",
-            "!",
-        ] + [f" {round(x, 5)}" for x in intervals]
-
-        if self.comment is not None:
-            scl_lines += ["!", f"! {self.comment}"]
-
-        scl_lines += REFERENCE_LINES + [
-            "!",
-            "! [info]",
-            "! source = Divisions of the Tetrachord",
-            f"! catalog_index = {self.index}",
-        ]
-
-        scl_text = "\n".join(scl_lines) + "\n"
+            (round(x, 5) for x in intervals),
+            self.index,
+            self.comment,
+        )
 
         return filename, scl_text
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CentsTetrachord:
     index: int
     cents: tuple[float, float, float]
@@ -361,72 +368,63 @@ class CentsTetrachord:
     def to_scl(self):
         filename = FILENAME.format(self.index, self.genus)
 
-        intervals = []
-        current_interval = 0.0
-        for step in self.cents:
-            current_interval += step
-            intervals.append(current_interval)
+        intervals = csum(map(float, self.cents))
 
         assert len(intervals) == 3
         assert abs(intervals[-1] - 500.0) <= 0.25
 
-        description = "Tempered tetrachord in cents " + " + ".join(
-            str(x) for x in self.cents
-        )
+        description = "Tempered tetrachord in cents " + " + ".join(map(str, self.cents))
         if self.reference is not None:
             description += f", {self.reference}"
 
-        scl_lines = [
-            f"! {filename}",
-            "!",
+        scl_text = render_scl(
+            filename,
             description,
-            " 3",
-            "!",
-        ] + [f" {round(x, 5)}" for x in intervals]
+            (round(x, 5) for x in intervals),
+            self.index,
+            self.comment,
+        )
 
-        if self.comment is not None:
-            scl_lines += ["!", f"! {self.comment}"]
+        return filename, scl_text
 
-        scl_lines += REFERENCE_LINES + [
-            "!",
-            "! [info]",
-            "! source = Divisions of the Tetrachord",
-            f"! catalog_index = {self.index}",
-        ]
 
-        scl_text = "\n".join(scl_lines) + "\n"
+@functools.cache
+def cached_simplify(x):
+    """Simplify with SymPy, reusing results for repeated interval products."""
+    from sympy import simplify
 
-        return filename, scl_text
+    return simplify(x)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SemiTemperedTetrachord:
     index: int
-    steps: tuple[Expr | float, Expr | float, Expr | float]
+    steps: "tuple[Expr | float, Expr | float, Expr | float]"
     cents: tuple[int, int, int]
     genus: str
     reference: Optional[str] = None
     comment: Optional[str] = None
 
     def __post_init__(self):
+        from sympy import Expr, Rational, evaluate
+
         with evaluate(True):
             product = math.prod(self.steps)
             if isinstance(product, Expr):
-                assert simplify(product) == Rational(4, 3)
+                assert cached_simplify(product) == Rational(4, 3)
             else:
                 assert abs(1200 * math.log2(product / (4 / 3))) <= 0.15
 
     def to_scl(self):
+        from sympy import Expr
+
         filename = FILENAME.format(self.index, self.genus)
 
-        for step, cents in zip(self.steps, self.cents):
-            assert abs(round(1200 * math.log2(step)) - cents) <= 1
+        if __debug__:
+            for step, cents in zip(self.steps, self.cents):
+                assert abs(round(1200 * math.log2(step)) - cents) <= 1
 
-        intervals = []
-        current_interval = 1
-        for step in self.steps:
-            current_interval *= step
-            intervals.append(simplify(current_interval))
+        intervals = [cached_simplify(x) for x in cprod(self.steps)]
 
         assert len(intervals) == 3
 
@@ -437,36 +435,19 @@ class SemiTemperedTetrachord:
             for x in intervals
         ]
 
-        description = "Semi-tempered tetrachord " + " * ".join(
-            str(x) for x in self.steps
-        )
+        description = "Semi-tempered tetrachord " + " * ".join(map(str, self.steps))
         if self.reference is not None:
             description += f", {self.reference}"
 
-        scl_lines = [
-            f"! {filename}",
-            "!",
-            description,
-            " 3",
-            "!",
-        ] + [f" {x}" for x in scl_intervals]
-
-        if self.comment is not None:
-            scl_lines += ["!", f"! {self.comment}"]
-
-        scl_lines += REFERENCE_LINES + [
-            "!",
-            "! [info]",
-            "! source = Divisions of the Tetrachord",
-            f"! catalog_index = {self.index}",
-        ]
-
-        scl_text = "\n".join(scl_lines) + "\n"
+        scl_text = render_scl(
+            filename, description, scl_intervals, self.index, self.comment
+        )
 
         return filename, scl_text
 
 
-CATALOG = [
+# All tetrachords except the semi-tempered ones, which need SymPy
+_CATALOG = (
     #
     # MAIN CATALOG
     #
@@ -3933,221 +3914,234 @@ CATALOG = [
         cents=(145, 165, 190),
         reference=R.chapter_5,
     ),
-]
+)
 
 
-# Symbolic Fraction
-def f(x, y):
-    return Integer(x) / y
+def _semi_tempered_tetrachords():
+    from sympy import Integer, evaluate, sqrt
 
+    # Symbolic Fraction
+    def f(x, y):
+        return Integer(x) / y
 
-A = f(4, 3)
+    A = f(4, 3)
 
-# Add semi-tempered tetrachords
-# Use sympy evaluate False so 1/sqrt(3) isn't rewritten as sqrt(3)/3
-with evaluate(False):
-    CATALOG += [
-        SemiTemperedTetrachord(
-            index=692,
-            genus="S1",
-            steps=(16 / (9 * sqrt(3)), 16 / (9 * sqrt(3)), F(81, 64)),
-            cents=(45, 45, 408),
-        ),
-        SemiTemperedTetrachord(
-            index=693,
-            genus="S2",
-            steps=(1.26376, 1.05231, 1.00260),
-            cents=(405, 88, 4),
-            comment="Originally printed as 1.26376 * 1.05321 * 1.00260",
-        ),
-        SemiTemperedTetrachord(
-            index=694,
-            genus="S3",
-            steps=(A ** f(1, 10), A ** f(1, 10), A ** f(8, 10)),
-            cents=(50, 50, 398),
-        ),
-        SemiTemperedTetrachord(
-            index=695,
-            genus="S4",
-            steps=(A ** f(2, 15), A ** f(2, 15), A ** f(11, 15)),
-            cents=(66, 66, 365),
-        ),
-        SemiTemperedTetrachord(
-            index=696,
-            genus="S5",
-            steps=(A ** f(3, 20), A ** f(7, 60), A ** f(11, 15)),
-            cents=(75, 58, 365),
-        ),
-        SemiTemperedTetrachord(
-            index=697,
-            genus="S6",
-            steps=(A ** f(3, 20), A ** f(3, 20), A ** f(7, 10)),
-            cents=(75, 75, 349),
-        ),
-        SemiTemperedTetrachord(
-            index=698,
-            genus="S7",
-            steps=(A ** f(1, 5), A ** f(1, 10), A ** f(7, 10)),
-            cents=(100, 50, 349),
-        ),
-        SemiTemperedTetrachord(
-            index=699,
-            genus="S8",
-            steps=(1.21677, 1.03862, 1.05505),
-            cents=(340, 66, 93),
-        ),
-        SemiTemperedTetrachord(
-            index=700,
-            genus="S9",
-            steps=(A ** f(1, 5), A ** f(1, 5), A ** f(3, 5)),
-            cents=(100, 100, 299),
-        ),
-        SemiTemperedTetrachord(
-            index=701,
-            genus="S10",
-            steps=(A ** f(2, 15), A ** f(4, 15), A ** f(3, 5)),
-            cents=(66, 133, 299),
-        ),
-        SemiTemperedTetrachord(
-            index=702,
-            genus="S11",
-            steps=((3 * sqrt(2)) / 4, (3 * sqrt(2)) / 4, f(32, 27)),
-            cents=(102, 102, 294),
-        ),
-        SemiTemperedTetrachord(
-            index=703,
-            genus="S12",
-            steps=(1.18046, 1.06685, 1.05873),
-            cents=(287, 112, 99),
-        ),
-        SemiTemperedTetrachord(
-            index=704,
-            genus="S13",
-            steps=(1.05956, 1.06763, 1.17876),
-            cents=(100, 113, 285),
-        ),
-        SemiTemperedTetrachord(
-            index=705,
-            genus="S14",
-            steps=(1.17867, 1.06763, 1.05963),
-            cents=(285, 113, 100),
-        ),
-        SemiTemperedTetrachord(
-            index=706,
-            genus="S15",
-            steps=(1.17851, 1.06771, 1.05963),
-            cents=(284, 113, 100),
-        ),
-        # TODO calculate S16 using mean 6
-        SemiTemperedTetrachord(
-            index=707,
-            genus="S16",
-            steps=(1.17691, 1.06807, 1.06069),
-            cents=(282, 114, 102),
-            comment="Originally printed as 1.17851 * 1.06771 * 1.05963, same as S15",
-        ),
-        SemiTemperedTetrachord(
-            index=708,
-            genus="S17",
-            steps=(A ** f(1, 5), A ** f(3, 10), A ** f(1, 2)),
-            cents=(100, 149, 250),
-        ),
-        SemiTemperedTetrachord(
-            index=709,
-            genus="S18",
-            steps=(1.07457, 1.07457, 1.154701),
-            cents=(125, 125, 249),
-        ),
-        SemiTemperedTetrachord(
-            index=710,
-            genus="S19",
-            steps=(A ** f(2, 15), A ** f(7, 15), A ** f(2, 5)),
-            cents=(66, 232, 199),
-        ),
-        SemiTemperedTetrachord(
-            index=711,
-            genus="S20",
-            steps=(1.13847, 1.1250, 1.0410),
-            cents=(225, 204, 70),
-        ),
-        SemiTemperedTetrachord(
-            index=712,
-            genus="S21",
-            steps=(A ** f(3, 20), A ** f(9, 20), A ** f(2, 5)),
-            cents=(75, 224, 199),
-        ),
-        SemiTemperedTetrachord(
-            index=713,
-            genus="S22",
-            steps=(1.13371, 1.1250, 1.04540),
-            cents=(217, 204, 77),
-        ),
-        SemiTemperedTetrachord(
-            index=714,
-            genus="S23",
-            steps=(1.13315, 1.1250, 1.04595),
-            cents=(216, 204, 78),
-        ),
-        SemiTemperedTetrachord(
-            index=715,
-            genus="S24",
-            steps=(1.09185, 1.07803, 1.13278),
-            cents=(152, 130, 216),
-        ),
-        SemiTemperedTetrachord(
-            index=716,
-            genus="S25",
-            steps=(1.09291, 1.078328, 1.13137),
-            cents=(154, 131, 214),
-        ),
-        SemiTemperedTetrachord(
-            index=717,
-            genus="S26",
-            steps=(1.09301, 1.07837, 1.13122),
-            cents=(154, 131, 213),
-        ),
-        SemiTemperedTetrachord(
-            index=718,
-            genus="S27",
-            steps=(1.09429, 1.07874, 1.12950),
-            cents=(156, 131, 211),
-        ),
-        SemiTemperedTetrachord(
-            index=719,
-            genus="S28",
-            steps=(1.12950, 1.1250, 1.04930),
-            cents=(211, 204, 83),
-        ),
-        SemiTemperedTetrachord(
-            index=720,
-            genus="S29",
-            steps=(1.08866, 1.1250, 1.08866),
-            cents=(147, 204, 147),
-        ),
-        SemiTemperedTetrachord(
-            index=721,
-            genus="S30",
-            steps=(A ** f(1, 5), A ** f(2, 5), A ** f(2, 5)),
-            cents=(100, 199, 199),
-        ),
-        SemiTemperedTetrachord(
-            index=722,
-            genus="S31",
-            steps=(A ** f(1, 3), A ** f(1, 3), A ** f(1, 3)),
-            cents=(166, 166, 166),
-        ),
-        SemiTemperedTetrachord(
-            index=723,
-            genus="S32",
-            steps=(A ** f(2, 5), A ** f(3, 10), A ** f(3, 10)),
-            cents=(200, 149, 149),
-        ),
-    ]
+    # Use sympy evaluate False so 1/sqrt(3) isn't rewritten as sqrt(3)/3
+    with evaluate(False):
+        return (
+            SemiTemperedTetrachord(
+                index=692,
+                genus="S1",
+                steps=(16 / (9 * sqrt(3)), 16 / (9 * sqrt(3)), F(81, 64)),
+                cents=(45, 45, 408),
+            ),
+            SemiTemperedTetrachord(
+                index=693,
+                genus="S2",
+                steps=(1.26376, 1.05231, 1.00260),
+                cents=(405, 88, 4),
+                comment="Originally printed as 1.26376 * 1.05321 * 1.00260",
+            ),
+            SemiTemperedTetrachord(
+                index=694,
+                genus="S3",
+                steps=(A ** f(1, 10), A ** f(1, 10), A ** f(8, 10)),
+                cents=(50, 50, 398),
+            ),
+            SemiTemperedTetrachord(
+                index=695,
+                genus="S4",
+                steps=(A ** f(2, 15), A ** f(2, 15), A ** f(11, 15)),
+                cents=(66, 66, 365),
+            ),
+            SemiTemperedTetrachord(
+                index=696,
+                genus="S5",
+                steps=(A ** f(3, 20), A ** f(7, 60), A ** f(11, 15)),
+                cents=(75, 58, 365),
+            ),
+            SemiTemperedTetrachord(
+                index=697,
+                genus="S6",
+                steps=(A ** f(3, 20), A ** f(3, 20), A ** f(7, 10)),
+                cents=(75, 75, 349),
+            ),
+            SemiTemperedTetrachord(
+                index=698,
+                genus="S7",
+                steps=(A ** f(1, 5), A ** f(1, 10), A ** f(7, 10)),
+                cents=(100, 50, 349),
+            ),
+            SemiTemperedTetrachord(
+                index=699,
+                genus="S8",
+                steps=(1.21677, 1.03862, 1.05505),
+                cents=(340, 66, 93),
+            ),
+            SemiTemperedTetrachord(
+                index=700,
+                genus="S9",
+                steps=(A ** f(1, 5), A ** f(1, 5), A ** f(3, 5)),
+                cents=(100, 100, 299),
+            ),
+            SemiTemperedTetrachord(
+                index=701,
+                genus="S10",
+                steps=(A ** f(2, 15), A ** f(4, 15), A ** f(3, 5)),
+                cents=(66, 133, 299),
+            ),
+            SemiTemperedTetrachord(
+                index=702,
+                genus="S11",
+                steps=((3 * sqrt(2)) / 4, (3 * sqrt(2)) / 4, f(32, 27)),
+                cents=(102, 102, 294),
+            ),
+            SemiTemperedTetrachord(
+                index=703,
+                genus="S12",
+                steps=(1.18046, 1.06685, 1.05873),
+                cents=(287, 112, 99),
+            ),
+            SemiTemperedTetrachord(
+                index=704,
+                genus="S13",
+                steps=(1.05956, 1.06763, 1.17876),
+                cents=(100, 113, 285),
+            ),
+            SemiTemperedTetrachord(
+                index=705,
+                genus="S14",
+                steps=(1.17867, 1.06763, 1.05963),
+                cents=(285, 113, 100),
+            ),
+            SemiTemperedTetrachord(
+                index=706,
+                genus="S15",
+                steps=(1.17851, 1.06771, 1.05963),
+                cents=(284, 113, 100),
+            ),
+            # TODO calculate S16 using mean 6
+            SemiTemperedTetrachord(
+                index=707,
+                genus="S16",
+                steps=(1.17691, 1.06807, 1.06069),
+                cents=(282, 114, 102),
+                comment="Originally printed as 1.17851 * 1.06771 * 1.05963, same as S15",
+            ),
+            SemiTemperedTetrachord(
+                index=708,
+                genus="S17",
+                steps=(A ** f(1, 5), A ** f(3, 10), A ** f(1, 2)),
+                cents=(100, 149, 250),
+            ),
+            SemiTemperedTetrachord(
+                index=709,
+                genus="S18",
+                steps=(1.07457, 1.07457, 1.154701),
+                cents=(125, 125, 249),
+            ),
+            SemiTemperedTetrachord(
+                index=710,
+                genus="S19",
+                steps=(A ** f(2, 15), A ** f(7, 15), A ** f(2, 5)),
+                cents=(66, 232, 199),
+            ),
+            SemiTemperedTetrachord(
+                index=711,
+                genus="S20",
+                steps=(1.13847, 1.1250, 1.0410),
+                cents=(225, 204, 70),
+            ),
+            SemiTemperedTetrachord(
+                index=712,
+                genus="S21",
+                steps=(A ** f(3, 20), A ** f(9, 20), A ** f(2, 5)),
+                cents=(75, 224, 199),
+            ),
+            SemiTemperedTetrachord(
+                index=713,
+                genus="S22",
+                steps=(1.13371, 1.1250, 1.04540),
+                cents=(217, 204, 77),
+            ),
+            SemiTemperedTetrachord(
+                index=714,
+                genus="S23",
+                steps=(1.13315, 1.1250, 1.04595),
+                cents=(216, 204, 78),
+            ),
+            SemiTemperedTetrachord(
+                index=715,
+                genus="S24",
+                steps=(1.09185, 1.07803, 1.13278),
+                cents=(152, 130, 216),
+            ),
+            SemiTemperedTetrachord(
+                index=716,
+                genus="S25",
+                steps=(1.09291, 1.078328, 1.13137),
+                cents=(154, 131, 214),
+            ),
+            SemiTemperedTetrachord(
+                index=717,
+                genus="S26",
+                steps=(1.09301, 1.07837, 1.13122),
+                cents=(154, 131, 213),
+            ),
+            SemiTemperedTetrachord(
+                index=718,
+                genus="S27",
+                steps=(1.09429, 1.07874, 1.12950),
+                cents=(156, 131, 211),
+            ),
+            SemiTemperedTetrachord(
+                index=719,
+                genus="S28",
+                steps=(1.12950, 1.1250, 1.04930),
+                cents=(211, 204, 83),
+            ),
+            SemiTemperedTetrachord(
+                index=720,
+                genus="S29",
+                steps=(1.08866, 1.1250, 1.08866),
+                cents=(147, 204, 147),
+            ),
+            SemiTemperedTetrachord(
+                index=721,
+                genus="S30",
+                steps=(A ** f(1, 5), A ** f(2, 5), A ** f(2, 5)),
+                cents=(100, 199, 199),
+            ),
+            SemiTemperedTetrachord(
+                index=722,
+                genus="S31",
+                steps=(A ** f(1, 3), A ** f(1, 3), A ** f(1, 3)),
+                cents=(166, 166, 166),
+            ),
+            SemiTemperedTetrachord(
+                index=723,
+                genus="S32",
+                steps=(A ** f(2, 5), A ** f(3, 10), A ** f(3, 10)),
+                cents=(200, 149, 149),
+            ),
+        )
+
+
+@functools.cache
+def catalog():
+    """Return the full catalog, building the semi-tempered tetrachords on first use."""
+    return _CATALOG + _semi_tempered_tetrachords()
+
+
+def __getattr__(name):
+    if name == "CATALOG":
+        return catalog()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def validate_catalog():
-    group = defaultdict(lambda: set())
-    for i, t in enumerate(CATALOG, 1):
+    group = defaultdict(set)
+    for i, t in enumerate(catalog(), 1):
         assert t.index == i
         # Tetrachord 295 doesn't contain the characteristic interval of its genus
         if t.genus in CHARACTERISTIC_INTERVAL and t.index not in {295}:
@@ -4163,24 +4157,21 @@ def validate_catalog():
     duplicates = {k: v for k, v in group.items() if len(v) > 1}
     assert not duplicates
 
-    assert len(CATALOG) == 723
+    assert len(catalog()) == 723
 
 
-def category(t: Tetrachord):
-    return {
-        "H": "Hyperenharmonic",
-        "E": "Enharmonic",
-        "C": "Chromatic",
-        "D": "Diatonic",
-        "R": "Reduplicated",
-        "M": "Miscellaneous",
-    }[t.genus[0]]
+CATEGORY = {
+    "H": "Hyperenharmonic",
+    "E": "Enharmonic",
+    "C": "Chromatic",
+    "D": "Diatonic",
+    "R": "Reduplicated",
+    "M": "Miscellaneous",
+}
 
 
-def write_tetrachord_scl(t: Tetrachord):
-    filename, scl_text = t.to_scl()
-    (OUTPUT_DIR / filename).write_text(scl_text)
-    return filename
+def category(t: Tetrachord):
+    return CATEGORY[t.genus[0]]
 
 
 def main():
@@ -4188,13 +4179,12 @@ def main():
     shutil.rmtree(OUTPUT_DIR, ignore_errors=True)
     OUTPUT_DIR.mkdir()
     validate_catalog()
-    references = {}
     reference = (
         f"{Author.chalmers}, Divisions of the Tetrachord, Frog Peak Music, 1993."
     )
-    for tetrachord in CATALOG:
-        filename = write_tetrachord_scl(tetrachord)
-        references[filename] = reference
+    scl_texts = dict(tetrachord.to_scl() for tetrachord in catalog())
+    utils.write_scl_files(OUTPUT_DIR, scl_texts)
+    references = dict.fromkeys(scl_texts, reference)
 
     return utils.check_scl_dir(OUTPUT_DIR), references
 
@@ -7,7 +7,9 @@ Run on scales in a given scale_dir as
 
 """
 
+import functools
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -20,16 +22,33 @@ from scale_library.utils import base_tone_string
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def prime_limit(n, d):
+    """Largest prime factor of n/d, cached as ratios repeat across scales."""
+    return max(factorrat(Rational(n, d)), default=0)
+
+
+def scl_files(scale_dir):
+    """
+    Yield (directory, path, filename) for each scl file under scale_dir.
+
+    Uses os.walk with plain strings, which is much cheaper than Path.rglob
+    plus Path.relative_to per file. directory is relative to scale_dir.
+    """
+    for dir_path, _, filenames in os.walk(scale_dir):
+        directory = os.path.relpath(dir_path, scale_dir)
+        for filename in filenames:
+            if filename.endswith(".scl"):
+                yield directory, os.path.join(dir_path, filename), filename
+
+
 def build_index(scale_dir, references=None):
     rows = []
-    for p in scale_dir.rglob("**/*.scl"):
+    for directory, p, filename in scl_files(scale_dir):
         scale = tl.read_scl_file(p)
         just = all(t.type == tl.Type.kToneRatio for t in scale.tones)
         if just:
-            limit = max(
-                max(factorrat(Rational(t.ratio_n, t.ratio_d)), default=0)
-                for t in scale.tones
-            )
+            limit = max(prime_limit(t.ratio_n, t.ratio_d) for t in scale.tones)
         else:
             limit = 0
 
@@ -48,8 +67,8 @@ def build_index(scale_dir, references=None):
 
         rows.append(
             (
-                str(p.relative_to(scale_dir).parent),
-                p.name,
+                directory,
+                filename,
                 scale.count,
                 period,
                 just,
@@ -24,10 +24,40 @@ from typing import Any
 import tuning_library as tl
 
 from scale_library import SCALES_DIR, SOURCES_DIR
-from scale_library.utils import check_scl_dir, validate_scale
+from scale_library.utils import check_scl_dir, validate_scale, write_scl_files
 
 logger = logging.getLogger(__name__)
 
+# Lines which may begin an scl file, e.g. "! 12-edo.scl"
+_SCL_START = re.compile("!.*scl")
+
+# Characters to drop or replace in scl filenames taken from a first line
+_FILENAME_TRANSLATION = str.maketrans(
+    {
+        "!": None,
+        " ": None,
+        "=": None,
+        "#": "s",
+        "[": None,
+        "]": None,
+        "+": "plus",
+        ",": None,
+        "&": "and",
+        "\\": "/",
+    }
+)
+
+# Mailing lists from biggest to smallest
+LIST_ORDER = {
+    "tuning": 0,
+    "makemicromusic": 1,
+    "tuning-math": 2,
+    "metatuning": 3,
+    "mills-tuning-list": 4,
+    "harmonic_entropy": 5,
+    "crazy_music": 6,
+}
+
 
 @dataclass(frozen=True)
 class Result:
@@ -37,6 +67,39 @@ class Result:
     json_file_path: Path
 
 
+def scl_length(lines):
+    """
+    Find the fewest leading lines which parse as an scl file, or None.
+
+    Lines after the last note are ignored when parsing, so once a prefix
+    parses every longer one does too. Search by doubling then bisecting.
+    """
+
+    def parses(i):
+        try:
+            tl.parse_scl_data("\n".join(lines[:i]))
+            return True
+        except tl.TuningError:
+            return False
+
+    # As before, try prefixes up to but not including the final line
+    end = len(lines) - 1
+    if end < 1:
+        return None
+    lo, hi = 0, 1
+    while not parses(hi):
+        if hi == end:
+            return None
+        lo, hi = hi, min(2 * hi, end)
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if parses(mid):
+            hi = mid
+        else:
+            lo = mid
+    return hi
+
+
 def extract_scales():
     logger.info("Building mailing list scales")
     results = []
@@ -46,6 +109,7 @@ def extract_scales():
     for p in list(source_dir.rglob("*messages*json"))[:]:
         logger.debug("Reading %s", p)
         messages = json.loads(p.read_text())
+        list_name = p.parents[1].name
 
         for message in messages:
             if "rawEmail" not in message:
@@ -66,24 +130,13 @@ def extract_scales():
 
             # Look for possible beginnings of scl files
             scl_starts = [
-                i for i, line in enumerate(email_lines) if re.match(".*!.*scl.*", line)
+                i for i, line in enumerate(email_lines) if _SCL_START.search(line)
             ]
 
             for scl_start in scl_starts:
-                # Try parsing the lines after the scl file start.
-                # Keep adding lines, stop if scl file successfully parsed.
-                found = False
-                for i in range(len(email_lines) - scl_start):
-                    try:
-                        tl.parse_scl_data(
-                            "\n".join(email_lines[scl_start : scl_start + i])
-                        )
-                        list_name = p.parents[1].name
-                        found = True
-                        break
-                    except tl.TuningError:
-                        pass
-                if found:
+                # Find the fewest lines after the scl file start which parse
+                i = scl_length(email_lines[scl_start:])
+                if i is not None:
                     # Some scl files contain comments after the scale notes
                     # So include any comment lines following a successfully parsed scl file
                     while (scl_start + i) < len(email_lines) and email_lines[
@@ -115,18 +168,10 @@ def write_out_results(results):
     # To avoid duplicate scales, keep only the first scl file containing given tones.
     # Choose the scl file from the biggest mailing list, then with the lowest msgId.
     def sort_key(result):
-        order = {
-            "tuning": 0,
-            "makemicromusic": 1,
-            "tuning-math": 2,
-            "metatuning": 3,
-            "mills-tuning-list": 4,
-            "harmonic_entropy": 5,
-            "crazy_music": 6,
-        }
-        return (order[result.list_name], result.message["msgId"])
+        return (LIST_ORDER[result.list_name], result.message["msgId"])
 
     references = {}
+    scl_texts = {}
     for i, result in enumerate(sorted(results, key=sort_key)):
         scale = result.scale
         list_name = result.list_name
@@ -134,20 +179,9 @@ def write_out_results(results):
         json_file_path = result.json_file_path
 
         first_line = scale.raw_text.splitlines()[0]
-        filename = Path(
-            first_line.replace("!", "")
-            .replace(" ", "")
-            .replace("=", "")
-            .replace("#", "s")
-            .replace("[", "")
-            .replace("]", "")
-            .replace("+", "plus")
-            .replace(",", "")
-            .replace("&", "and")
-            .replace("\\", "/")
-        ).name
+        filename = Path(first_line.translate(_FILENAME_TRANSLATION)).name
         sep = ".scl"
-        filename = Path(filename.split(sep)[0] + sep)
+        filename = filename.split(sep)[0] + sep
 
         if not validate_scale(scale):
             logger.debug("Failed %s", filename)
@@ -163,10 +197,11 @@ def write_out_results(results):
         # If filenames clash, append the list name, topicId, and msgId.
         if filename in filenames:
             logger.debug("Filename clash for %s", filename)
-            filename = Path(
-                filename.stem
+            clash = Path(filename)
+            filename = (
+                clash.stem
                 + f"_{list_name}_{message['topicId']}_{message['msgId']}"
-                + filename.suffix
+                + clash.suffix
             )
             logger.debug("Using filename %s", filename)
 
@@ -177,24 +212,21 @@ def write_out_results(results):
         topicId = message["topicId"]
         msgId = message["msgId"]
         url = f"https://yahootuninggroupsultimatebackup.github.io/{list_name}/topicId_{topicId}.html#{msgId}"
-        references[filename.name] = url
+        references[filename] = url
         text = (
-            "\n".join(
-                [
-                    scale.raw_text.rstrip(),
-                    "!",
-                    f"! {url}",
-                    "!",
-                    "! [info]",
-                    "! source = Mailing lists",
-                    f"! file = {json_file_path}",
-                    f"! topic_id = {topicId}",
-                    f"! msg_id = {msgId}",
-                ]
-            )
-            + "\n"
+            f"{scale.raw_text.rstrip()}\n"
+            "!\n"
+            f"! {url}\n"
+            "!\n"
+            "! [info]\n"
+            "! source = Mailing lists\n"
+            f"! file = {json_file_path}\n"
+            f"! topic_id = {topicId}\n"
+            f"! msg_id = {msgId}\n"
         )
-        (result_dir / filename).write_text(text)
+        scl_texts[filename] = text
+
+    write_scl_files(result_dir, scl_texts)
 
     return check_scl_dir(result_dir), references
 
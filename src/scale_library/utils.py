@@ -16,6 +16,9 @@ import tuning_library as tl
 
 logger = logging.getLogger(__name__)
 
+# Characters allowed in a tone, once comments are stripped
+_TONE_TEXT = re.compile(r"[0-9./\s-]*")
+
 
 def check_count_line(scl_text):
     """
@@ -55,7 +58,7 @@ def validate_scale(scale):
         return False
     for t in scale.tones:
         tone_text = base_tone_string(t.string_rep)
-        if not re.fullmatch(r"[0-9./\s-]*", tone_text):
+        if not _TONE_TEXT.fullmatch(tone_text):
             logger.debug("Failed tone %s", t)
             return False
         try:
@@ -120,6 +123,18 @@ def check_scl_dir(dir_path):
     return count
 
 
+def write_scl_files(dir_path, scl_texts):
+    """
+    Write scl files into dir_path in a single pass.
+
+    Args:
+        dir_path: directory to write the scl files into
+        scl_texts: dict of scl filename to scl file text
+    """
+    for filename, scl_text in scl_texts.items():
+        (dir_path / filename).write_text(scl_text)
+
+
 def setup_logging():
     logging.basicConfig(
         level=os.getenv("LOGLEVEL", logging.INFO),
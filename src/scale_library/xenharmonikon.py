@@ -5131,7 +5131,7 @@ def xen12_wilson_20b_genus(f):
         combinations(numbers, i) for i in range(len(numbers) + 1)
     )
     # Multiple factors can give same ratio (because of 1)
-    tones_and_labels = defaultdict(lambda: [])
+    tones_and_labels = defaultdict(list)
     for x in factors:
         tones_and_labels[reduce(F(math.prod(x)))].append("*".join(map(str, x)))
     tones = [
@@ -5241,7 +5241,7 @@ def xen12_wilson_23_genus(f):
         )
     )
     # Multiple factors can give same ratio (because of 1)
-    tones_and_labels = defaultdict(lambda: [])
+    tones_and_labels = defaultdict(list)
     for x in factors:
         tones_and_labels[reduce(F(math.prod(x)))].append("*".join(map(str, x)))
     tones = [
@@ -5789,7 +5789,7 @@ def xen12_wilson_42_ogdoadic_tileburst_1(f):
         (3, 5, 13, 15),
     ]
     assert len(labels) == len(set(labels))
-    ratios_dict = defaultdict(lambda: [])
+    ratios_dict = defaultdict(list)
     for x in labels:
         ratio = reduce(F(math.prod(x)))
         label_str = "*".join(map(str, x))
@@ -5837,7 +5837,7 @@ def xen12_wilson_42_ogdoadic_tileburst_2(f):
         (3, 5, 13, 15),
     ]
     assert len(labels) == len(set(labels))
-    ratios_dict = defaultdict(lambda: [])
+    ratios_dict = defaultdict(list)
     for x in labels:
         ratio = reduce(F(math.prod(x), 7 * 9))
         label_str = "*".join(map(str, x))
@@ -5885,7 +5885,7 @@ def xen12_wilson_42_ogdoadic_tileburst_3(f):
         (F(3, 9),),
     ]
     assert len(labels) == len(set(labels))
-    ratios_dict = defaultdict(lambda: [])
+    ratios_dict = defaultdict(list)
     for x in labels:
         ratio = reduce(F(7 * math.prod(x), 3))
         label_str = "*".join(map(str, x))
@@ -5935,7 +5935,7 @@ def xen12_wilson_42_ogdoadic_tileburst_4(f):
         (F(3, 9),),
     ]
     assert len(labels) == len(set(labels))
-    ratios_dict = defaultdict(lambda: [])
+    ratios_dict = defaultdict(list)
     for x in labels:
         ratio = reduce(F(math.prod(x)))
         label_str = "*".join(map(str, x))
@@ -7071,7 +7071,7 @@ def xen14_polansky_horn(f):
     series_on_f = [(x,) for x in harmonics]
     series_on_c = [(3, x) for x in harmonics]
     series_on_a = [(5, x) for x in harmonics]
-    ratios = defaultdict(lambda: [])
+    ratios = defaultdict(list)
     for x in series_on_f + series_on_c + series_on_a:
         ratios[reduce(F(math.prod(x)))].append("*".join(map(str, x)))
     tones = [T.from_fraction(k, comment=", ".join(v)) for k, v in ratios.items()]
@@ -8305,7 +8305,7 @@ def xen16_burt_drones_all(f):
         (81, 35, 1453),
     ]
     assert len(labels) == 16
-    ratios = defaultdict(lambda: [])
+    ratios = defaultdict(list)
     for numerator, denominator, cents in labels:
         assert round(1200 * log2(numerator / denominator)) == cents
         ratio = reduce(F(numerator, denominator))
@@ -8502,7 +8502,7 @@ def add_burt_drones():
 
         def build(f, labels=labels, i=i):
             assert len(labels) == 12
-            ratios = defaultdict(lambda: [])
+            ratios = defaultdict(list)
             for numerator, denominator in labels:
                 ratio = reduce(F(numerator, denominator))
                 ratios[ratio].append(f"{numerator}/{denominator}")
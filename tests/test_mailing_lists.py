@@ -0,0 +1,49 @@
+"""Tests for finding scl files in mailing-list emails."""
+
+import pytest
+import tuning_library as tl
+
+from scale_library.mailing_lists import scl_length
+
+SCL_LINES = ["! pythagorean.scl", "!", "Pythagorean fifth", " 2", "!", " 3/2", " 2/1"]
+PROSE_LINES = ["", "Thanks for the tip! The .scl format is handy.", "Best,", "Someone"]
+
+
+def _linear_scl_length(lines):
+    """Reference scan: grow the prefix one line at a time, as extract_scales did."""
+    for i in range(len(lines)):
+        try:
+            tl.parse_scl_data("\n".join(lines[:i]))
+            return i
+        except tl.TuningError:
+            pass
+    return None
+
+
+def test_notes_followed_by_prose():
+    assert scl_length(SCL_LINES + PROSE_LINES) == len(SCL_LINES)
+
+
+def test_never_parses():
+    assert scl_length(["! not-a-scale.scl"] + PROSE_LINES) is None
+
+
+def test_parses_only_with_final_line():
+    # The final line is never tried, matching the original scan
+    assert scl_length(SCL_LINES) is None
+
+
+@pytest.mark.parametrize(
+    "lines",
+    [
+        [],
+        ["! a.scl"],
+        SCL_LINES + ["!"],
+        SCL_LINES + [" 5/4", " 700.0"] + PROSE_LINES,
+        SCL_LINES[:4] + PROSE_LINES + SCL_LINES[4:] + PROSE_LINES,
+        ["! a.scl", "!", "desc", " 1", " 1200.0"] + PROSE_LINES * 5,
+    ],
+)
+def test_matches_linear_scan(lines):
+    # Doubling plus bisection relies on longer prefixes continuing to parse
+    assert scl_length(lines) == _linear_scl_length(lines)